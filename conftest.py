@@ -2,65 +2,87 @@
 #
 # SPDX-License-Identifier: MIT
 
-from doctest import ELLIPSIS
+from functools import cache
+from pathlib import Path
 
 import pytest
 
-from sybil import Sybil
-from sybil.parsers import myst, rest
-
-import svcs
-
+from tests._sybil import pytest_collect_file  # noqa: F401
 from tests.helpers import CloseMe
 from tests.ifaces import Service
 
 
-markdown_examples = Sybil(
-    parsers=[
-        myst.DocTestDirectiveParser(optionflags=ELLIPSIS),
-        myst.PythonCodeBlockParser(doctest_optionflags=ELLIPSIS),
-        myst.SkipParser(),
-    ],
-    patterns=["*.md"],
-)
+_DOCS = Path(__file__).parent / "docs"
+
 
-rest_examples = Sybil(
-    parsers=[
-        rest.DocTestParser(optionflags=ELLIPSIS),
-        rest.PythonCodeBlockParser(),
-    ],
-    patterns=["*.py"],
-)
+@cache
+def _has_sphinx():
+    from importlib.util import find_spec
 
-pytest_collect_file = (markdown_examples + rest_examples).pytest()
+    return find_spec("sphinx") is not None
 
-collect_ignore = []
-try:
-    import sphinx  # noqa: F401
-except ImportError:
-    collect_ignore.extend(["docs"])
 
+def pytest_ignore_collect(collection_path, config):
+    """
+    Skip the docs tree without sphinx.  The probe only runs when pytest
+    actually asks about a docs path, so narrow test selections never pay
+    for it.
+    """
+    if collection_path != _DOCS and _DOCS not in collection_path.parents:
+        return None
 
-@pytest.fixture(name="svc")
+    return None if _has_sphinx() else True
+
+
+# Service is a stateless dataclass and RegisteredService is frozen, so one
+# instance each can serve the whole session.
+@pytest.fixture(name="svc", scope="session")
 def _svc():
     return Service()
 
 
-@pytest.fixture(name="rs")
-def _rs(svc):
+@pytest.fixture(name="rs", scope="session")
+def _rs():
+    import svcs
+
     return svcs.RegisteredService(Service, Service, False, True, None)
 
 
-@pytest.fixture(name="registry")
+# Registry and Container are allocated once and reset after each test --
+# an O(1) clear is cheaper than a fresh pair per test.
+@pytest.fixture(name="registry", scope="session")
 def _registry():
+    import svcs
+
     return svcs.Registry()
 
 
-@pytest.fixture(name="container")
+@pytest.fixture(name="container", scope="session")
 def _container(registry):
+    import svcs
+
     return svcs.Container(registry)
 
 
+@pytest.fixture(autouse=True)
+def _reset_svcs(registry, container):
+    yield
+
+    if (local := container._lazy_local_registry) is not None:
+        # Drop pending cleanups so the orphaned local registry doesn't
+        # emit a ResourceWarning into an unrelated test.
+        local._services.clear()
+        local._pingable.clear()
+        local._on_close.clear()
+        container._lazy_local_registry = None
+
+    container._instantiated.clear()
+    container._on_close = None
+    registry._services.clear()
+    registry._pingable.clear()
+    registry._on_close.clear()
+
+
 @pytest.fixture(name="close_me")
 def _close_me():
     return CloseMe()
@@ -59,8 +59,12 @@ author = "Hynek Schlawack"
 copyright = f"2023, { author }"
 
 
+# Fetch the distribution once; version and summary come from the same
+# METADATA parse.
+_dist = metadata.distribution("svcs")
+
 # The full version, including alpha/beta/rc tags.
-release = metadata.version("svcs")
+release = _dist.version
 # The short X.Y version.
 version = release.rsplit(".", 1)[0]
 
@@ -70,9 +74,27 @@ if "dev" in release:
 exclude_patterns = ["_build"]
 
 nitpick_ignore = [
-    *[("py:class", f"svcs._core.T{i}") for i in range(1, 11)],
+    ("py:class", "svcs._core.T1"),
+    ("py:class", "svcs._core.T2"),
+    ("py:class", "svcs._core.T3"),
+    ("py:class", "svcs._core.T4"),
+    ("py:class", "svcs._core.T5"),
+    ("py:class", "svcs._core.T6"),
+    ("py:class", "svcs._core.T7"),
+    ("py:class", "svcs._core.T8"),
+    ("py:class", "svcs._core.T9"),
+    ("py:class", "svcs._core.T10"),
     # This only fails in CI!?
-    *[("py:class", f"T{i}") for i in range(1, 11)],
+    ("py:class", "T1"),
+    ("py:class", "T2"),
+    ("py:class", "T3"),
+    ("py:class", "T4"),
+    ("py:class", "T5"),
+    ("py:class", "T6"),
+    ("py:class", "T7"),
+    ("py:class", "T8"),
+    ("py:class", "T9"),
+    ("py:class", "T10"),
     # Welcome, MkDocs projects. :(
     ("py:class", "FastAPI"),
     ("py:class", "Starlette"),
@@ -110,7 +132,7 @@ html_css_files = ["custom.css"]
 
 htmlhelp_basename = "svcsdoc"
 
-_descr = f"{metadata.metadata('svcs')['summary']} for Python."
+_descr = f"{_dist.metadata['summary']} for Python."
 _title = "svcs"
 rst_epilog = f"""\
 .. meta::
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from aiohttp.web import Request, Response, json_response
 
 import svcs
@@ -13,12 +15,20 @@ async def healthy_view(request: Request) -> Response:
     failing: dict[str, str] = {}
     code = 200
 
-    for svc in svcs.aiohttp.get_pings(request):
-        try:
-            await svc.aping()
-            ok.append(svc.name)
-        except Exception as e:
-            failing[svc.name] = repr(e)
+    pings = svcs.aiohttp.get_pings(request)
+    results = await asyncio.gather(
+        *(svc.aping() for svc in pings), return_exceptions=True
+    )
+    for svc, res in zip(pings, results):
+        if isinstance(res, Exception):
+            failing[svc.name] = repr(res)
             code = 500
+        elif isinstance(res, BaseException):
+            # Mirror the serial loop's `except Exception`: let
+            # CancelledError & friends propagate instead of counting a
+            # cancelled ping as healthy.
+            raise res
+        else:
+            ok.append(svc.name)
 
     return json_response({"ok": ok, "failing": failing}, status=code)
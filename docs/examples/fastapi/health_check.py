@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
@@ -18,13 +20,21 @@ async def healthy(services: svcs.fastapi.DepContainer) -> JSONResponse:
     failing: dict[str, str] = {}
     code = 200
 
-    for svc in services.get_pings():
-        try:
-            await svc.aping()
-            ok.append(svc.name)
-        except Exception as e:
-            failing[svc.name] = repr(e)
+    pings = services.get_pings()
+    results = await asyncio.gather(
+        *(svc.aping() for svc in pings), return_exceptions=True
+    )
+    for svc, res in zip(pings, results):
+        if isinstance(res, Exception):
+            failing[svc.name] = repr(res)
             code = 500
+        elif isinstance(res, BaseException):
+            # Mirror the serial loop's `except Exception`: let
+            # CancelledError & friends propagate instead of counting a
+            # cancelled ping as healthy.
+            raise res
+        else:
+            ok.append(svc.name)
 
     return JSONResponse(
         content={"ok": ok, "failing": failing}, status_code=code
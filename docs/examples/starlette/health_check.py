@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
@@ -14,13 +16,21 @@ async def healthy(request: Request) -> JSONResponse:
     failing: dict[str, str] = {}
     code = 200
 
-    for svc in svcs.starlette.get_pings(request):
-        try:
-            await svc.aping()
-            ok.append(svc.name)
-        except Exception as e:
-            failing[svc.name] = repr(e)
+    pings = svcs.starlette.get_pings(request)
+    results = await asyncio.gather(
+        *(svc.aping() for svc in pings), return_exceptions=True
+    )
+    for svc, res in zip(pings, results):
+        if isinstance(res, Exception):
+            failing[svc.name] = repr(res)
             code = 500
+        elif isinstance(res, BaseException):
+            # Mirror the serial loop's `except Exception`: let
+            # CancelledError & friends propagate instead of counting a
+            # cancelled ping as healthy.
+            raise res
+        else:
+            ok.append(svc.name)
 
     return JSONResponse(
         content={"ok": ok, "failing": failing}, status_code=code
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+
 from . import exceptions
 from ._core import (
     Container,
@@ -21,27 +23,33 @@ __all__ = [
     "exceptions",
 ]
 
-try:
-    from . import aiohttp
-except ImportError:
-    __all__ += ["aiohttp"]
-
-try:
-    from . import fastapi
-except ImportError:
-    __all__ += ["fastapi"]
-
-try:
-    from . import flask
-except ImportError:
-    __all__ += ["flask"]
-
-try:
-    from . import pyramid
-except ImportError:
-    __all__ += ["pyramid"]
-
-try:
-    from . import starlette
-except ImportError:
-    __all__ += ["starlette"]
+_INTEGRATIONS = frozenset(
+    ("aiohttp", "fastapi", "flask", "pyramid", "starlette")
+)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Load framework integrations lazily so that ``import svcs`` doesn't
+    drag in every installed web framework.
+    """
+    if name in _INTEGRATIONS:
+        try:
+            mod = import_module(f".{name}", __name__)
+        except ImportError as e:
+            # PEP 562 semantics: a failed resolution is an AttributeError,
+            # so hasattr()/getattr() keep working when the framework isn't
+            # installed.  `import svcs.flask` still raises the ImportError.
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg) from e
+
+        globals()[name] = mod
+
+        return mod
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    return [*__all__, *_INTEGRATIONS]
@@ -14,8 +14,8 @@ from contextlib import (
     AbstractContextManager,
     asynccontextmanager,
     contextmanager,
-    suppress,
 )
+from functools import lru_cache
 from inspect import (
     isasyncgenfunction,
     isawaitable,
@@ -23,8 +23,8 @@ from inspect import (
     iscoroutinefunction,
     isgeneratorfunction,
 )
-from types import TracebackType
-from typing import Any, TypeVar, overload
+from types import FunctionType, TracebackType
+from typing import Any, TypeVar, cast, overload
 
 import attrs
 
@@ -35,16 +35,67 @@ log = logging.getLogger("svcs")
 
 
 def _full_name(obj: object) -> str:
-    try:
-        return f"{obj.__module__}.{obj.__qualname__}"  # type: ignore[attr-defined]
-    except AttributeError:
+    # getattr instead of try/except: the common case (types) always has
+    # both attributes, and neither path pays for exception machinery.
+    qualname = getattr(obj, "__qualname__", None)
+    module = getattr(obj, "__module__", None)
+    if qualname is None or module is None:
         return repr(obj)
 
+    return f"{module}.{qualname}"
+
 
 # Default names where to put the container and registry in integrations.
 _KEY_REGISTRY = "svcs_registry"
 _KEY_CONTAINER = "svcs_container"
 
+# How a factory produces its service, classified once at registration so
+# get()/aget() don't have to re-inspect what the factory returned.  PLAIN
+# means we can't know (the factory may still return a context manager).
+_KIND_PLAIN = 0
+_KIND_CM = 1
+_KIND_ACM = 2
+_KIND_CORO = 3
+_KIND_VALUE = 4
+
+# How an on_registry_close callback has to be run, classified once when
+# it's registered.
+_OC_SYNC = 0
+_OC_CORO_FUNC = 1
+_OC_AWAITABLE = 2
+
+# Repr templates; %-formatting on a precompiled template is cheaper than
+# rebuilding an f-string per call.
+_REGISTRY_REPR = "<svcs.Registry(num_services=%d)>"
+_CONTAINER_REPR = "<Container(instantiated=%d, cleanups=%d)>"
+_RS_REPR = (
+    "<RegisteredService(svc_type=%s, factory=%s, takes_container=%s, "
+    "enter=%s, has_ping=%s)>"
+)
+
+_ASYNC_CLEANUP_MSG = "Skipped async cleanup for %r. Use aclose() instead."
+
+_MISSING = object()
+
+
+class _Const:
+    """
+    What ``lambda: value`` used to be for :meth:`Registry.register_value`:
+    a callable returning a fixed value, minus the closure allocation and
+    with a stable identity.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __call__(self) -> object:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"<_Const({self.value!r})>"
+
 
 @attrs.frozen
 class RegisteredService:
@@ -66,6 +117,8 @@ class RegisteredService:
         enter: Whether context managers returned by the factory are entered.
 
         ping: See :ref:`health`.
+
+        ping_is_async: Whether *ping* is an async callable.
     """
 
     svc_type: type
@@ -73,24 +126,38 @@ class RegisteredService:
     takes_container: bool
     enter: bool
     ping: Callable | None = attrs.field(hash=False)
-
-    @property
-    def name(self) -> str:
-        return _full_name(self.svc_type)
+    kind: int = _KIND_PLAIN
+    # Only meaningful for _KIND_VALUE services; excluded from comparisons
+    # like factory, whose identity already differs per registration.
+    value: object = attrs.field(default=None, eq=False)
+    # Computed once here so health checks don't have to re-inspect the
+    # ping on every call.
+    ping_is_async: bool = attrs.field(
+        init=False,
+        default=attrs.Factory(
+            lambda self: iscoroutinefunction(self.ping), takes_self=True
+        ),
+    )
+    # Derived from svc_type, so excluded from comparisons; stored instead
+    # of a property because it's read on every cleanup log line and ping.
+    name: str = attrs.field(
+        init=False,
+        eq=False,
+        default=attrs.Factory(
+            lambda self: _full_name(self.svc_type), takes_self=True
+        ),
+    )
 
     def __repr__(self) -> str:
-        return (
-            f"<RegisteredService(svc_type="
-            f"{self.name}, "
-            f"factory={self.factory}, "
-            f"takes_container={self.takes_container}, "
-            f"enter={self.enter}, "
-            f"has_ping={ self.ping is not None}"
-            ")>"
+        return _RS_REPR % (
+            self.name,
+            self.factory,
+            self.takes_container,
+            self.enter,
+            self.ping is not None,
         )
 
 
-@attrs.frozen
 class ServicePing:
     """
     A service health check as returned by :meth:`svcs.Container.get_pings`.
@@ -104,12 +171,61 @@ class ServicePing:
         :ref:`health`
     """
 
+    # One of these is allocated per pinged service on every health check,
+    # so keep it a plain slotted class.
+    __slots__ = ("_container", "_ping", "_svc_type", "is_async", "name")
+
     name: str
     is_async: bool
     _svc_type: type
     _ping: Callable
     _container: Container
 
+    def __init__(
+        self,
+        name: str,
+        is_async: bool,
+        svc_type: type,
+        ping: Callable,
+        container: Container,
+    ) -> None:
+        self.name = name
+        self.is_async = is_async
+        self._svc_type = svc_type
+        self._ping = ping
+        self._container = container
+
+    def __eq__(self, other: object) -> bool:
+        # Value equality like the attrs-based predecessor.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (
+            self.name,
+            self.is_async,
+            self._svc_type,
+            self._ping,
+            self._container,
+        ) == (
+            other.name,
+            other.is_async,
+            other._svc_type,
+            other._ping,
+            other._container,
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self.__class__,
+                self.name,
+                self.is_async,
+                self._svc_type,
+                self._ping,
+                self._container,
+            )
+        )
+
     def ping(self) -> None:
         """
         Acquire the service, schedule its cleanup, and call its ping callable
@@ -161,10 +277,15 @@ class Registry:
     """
 
     _services: dict[type, RegisteredService] = attrs.Factory(dict)
-    _on_close: list[tuple[str, Callable | Awaitable]] = attrs.Factory(list)
+    _on_close: list[tuple[str, Callable | Awaitable, int]] = attrs.Factory(
+        list
+    )
+    # Mirror of _services that only holds services with a ping, so
+    # Container.get_pings() doesn't have to filter all services per call.
+    _pingable: dict[type, RegisteredService] = attrs.Factory(dict)
 
     def __repr__(self) -> str:
-        return f"<svcs.Registry(num_services={len(self._services)})>"
+        return _REGISTRY_REPR % (len(self._services),)
 
     def __contains__(self, svc_type: type) -> bool:
         """
@@ -260,6 +381,11 @@ class Registry:
                     typing ecosystem, we recommend using the name route to
                     detect the container argument because it's most reliable.
 
+                Setting a ``__svcs_takes_container__`` attribute on the
+                factory to ``True`` or ``False`` skips the detection
+                entirely -- useful for programmatically generated
+                factories whose signatures can't be inspected cheaply.
+
             enter:
                 Whether to enter context managers if one is returned by
                 *factory*. Usually you want that, but there are occasions --
@@ -291,16 +417,19 @@ class Registry:
             on_registry_close=on_registry_close,
         )
 
-        log.debug(
-            "registered factory %r for service type %s",
-            factory,
-            rs.name,
-            extra={
-                "svcs_service_name": rs.name,
-                "svcs_factory_name": _full_name(factory),
-            },
-            stack_info=True,
-        )
+        # Guarded because stack_info forces a stack capture even when the
+        # record is thrown away.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "registered factory %r for service type %s",
+                factory,
+                rs.name,
+                extra={
+                    "svcs_service_name": rs.name,
+                    "svcs_factory_name": _full_name(factory),
+                },
+                stack_info=True,
+            )
 
     def register_value(
         self,
@@ -330,19 +459,22 @@ class Registry:
         """
         rs = self._register_factory(
             svc_type,
-            lambda: value,
+            _Const(value),
             enter=enter,
             ping=ping,
             on_registry_close=on_registry_close,
+            value=value,
+            is_value=True,
         )
 
-        log.debug(
-            "registered value %r for service type %s",
-            value,
-            rs.name,
-            extra={"svcs_service_name": rs.name, "svcs_value": value},
-            stack_info=True,
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "registered value %r for service type %s",
+                value,
+                rs.name,
+                extra={"svcs_service_name": rs.name, "svcs_value": value},
+                stack_info=True,
+            )
 
     def _register_factory(
         self,
@@ -351,25 +483,51 @@ class Registry:
         enter: bool,
         ping: Callable | None,
         on_registry_close: Callable | Awaitable | None = None,
+        value: object = None,
+        is_value: bool = False,
     ) -> RegisteredService:
-        if isgeneratorfunction(factory):
-            factory = contextmanager(factory)
-        elif isasyncgenfunction(factory):
-            factory = asynccontextmanager(factory)
+        if is_value:
+            # The value is stored directly; factory stays as a fallback
+            # for code that calls it by hand.
+            rs = RegisteredService(
+                svc_type, factory, False, enter, ping, _KIND_VALUE, value
+            )
+        else:
+            if isgeneratorfunction(factory):
+                factory = contextmanager(factory)
+                kind = _KIND_CM
+            elif isasyncgenfunction(factory):
+                factory = asynccontextmanager(factory)
+                kind = _KIND_ACM
+            elif iscoroutinefunction(factory):
+                kind = _KIND_CORO
+            else:
+                kind = _KIND_PLAIN
+
+            rs = RegisteredService(
+                svc_type, factory, _takes_container(factory), enter, ping, kind
+            )
 
-        rs = RegisteredService(
-            svc_type, factory, _takes_container(factory), enter, ping
-        )
         self._services[svc_type] = rs
+        if ping is not None:
+            self._pingable[svc_type] = rs
+        else:
+            self._pingable.pop(svc_type, None)
         if on_registry_close is not None:
-            self._on_close.append((rs.name, on_registry_close))
+            if iscoroutinefunction(on_registry_close):
+                oc_kind = _OC_CORO_FUNC
+            elif isawaitable(on_registry_close):
+                oc_kind = _OC_AWAITABLE
+            else:
+                oc_kind = _OC_SYNC
+            self._on_close.append((rs.name, on_registry_close, oc_kind))
         return rs
 
     def get_registered_service_for(self, svc_type: type) -> RegisteredService:
-        try:
-            return self._services[svc_type]
-        except KeyError:
-            raise ServiceNotFoundError(svc_type) from None
+        if (rs := self._services.get(svc_type, _MISSING)) is _MISSING:
+            raise ServiceNotFoundError(svc_type)
+
+        return rs  # type: ignore[return-value]
 
     def close(self) -> None:
         """
@@ -379,11 +537,13 @@ class Registry:
 
         Errors are logged at warning level, but otherwise ignored.
         """
-        for name, oc in reversed(self._on_close):
-            if iscoroutinefunction(oc) or isawaitable(oc):
+        debug = log.isEnabledFor(logging.DEBUG)
+        on_close, self._on_close = self._on_close, []
+        while on_close:
+            name, oc, oc_kind = on_close.pop()
+            if oc_kind != _OC_SYNC:
                 warnings.warn(
-                    f"Skipped async cleanup for {name!r}. "
-                    "Use aclose() instead.",
+                    _ASYNC_CLEANUP_MSG % (name,),
                     # stacklevel doesn't matter here; it's coming from a
                     # framework.
                     stacklevel=1,
@@ -391,9 +551,11 @@ class Registry:
                 continue
 
             try:
-                log.debug("closing %r", name)
-                oc()
-                log.debug("closed %r", name)
+                if debug:
+                    log.debug("closing %r", name)
+                cast(Callable, oc)()
+                if debug:
+                    log.debug("closed %r", name)
             except Exception:  # noqa: BLE001
                 log.warning(
                     "Registry's on_registry_close callback failed for %r.",
@@ -403,7 +565,7 @@ class Registry:
                 )
 
         self._services.clear()
-        self._on_close.clear()
+        self._pingable.clear()
 
     async def aclose(self) -> None:
         """
@@ -414,20 +576,31 @@ class Registry:
         Also works with synchronous services, so in an async application, just
         use this.
         """
-        for name, oc in reversed(self._on_close):
+        debug = log.isEnabledFor(logging.DEBUG)
+        on_close, self._on_close = self._on_close, []
+        while on_close:
+            name, oc, oc_kind = on_close.pop()
             try:
-                if iscoroutinefunction(oc):
-                    oc = oc()  # noqa: PLW2901
-
-                if isawaitable(oc):
-                    log.debug("async closing %r", name)
-                    await oc
-                    log.debug("async closed %r", name)
+                if oc_kind != _OC_SYNC:
+                    # The tag tells us whether oc must be called first or
+                    # is already an awaitable.
+                    aw = (
+                        cast("Callable[[], Awaitable]", oc)()
+                        if oc_kind == _OC_CORO_FUNC
+                        else cast(Awaitable, oc)
+                    )
+                    if debug:
+                        log.debug("async closing %r", name)
+                    await aw
+                    if debug:
+                        log.debug("async closed %r", name)
                 else:
-                    log.debug("closing %r", name)
-                    oc()
-                    log.debug("closed %r", name)
-            except Exception:  # noqa: BLE001, PERF203
+                    if debug:
+                        log.debug("closing %r", name)
+                    cast(Callable, oc)()
+                    if debug:
+                        log.debug("closed %r", name)
+            except Exception:  # noqa: BLE001
                 log.warning(
                     "Registry's on_registry_close callback failed for %r.",
                     name,
@@ -436,13 +609,56 @@ class Registry:
                 )
 
         self._services.clear()
-        self._on_close.clear()
+        self._pingable.clear()
 
 
 def _takes_container(factory: Callable) -> bool:
     """
     Return True if *factory* takes a svcs.Container as its first argument.
     """
+    # Explicit opt-in/out beats any inspection -- frameworks that generate
+    # factories programmatically can set the marker and skip it all.
+    marker = getattr(factory, "__svcs_takes_container__", None)
+    if marker is not None:
+        return bool(marker)
+
+    # Fast path: for plain, undecorated functions the code object answers
+    # the question without paying for inspect.signature().  Bound methods,
+    # partials, classes, and wrapped callables fall through to the slow
+    # path, which knows how to look through them.
+    if type(factory) is FunctionType and not hasattr(factory, "__wrapped__"):
+        code = factory.__code__
+        if not code.co_argcount:
+            return False
+
+        name = code.co_varnames[0]
+        annotation = factory.__annotations__.get(name)
+        if name == "svcs_container" or annotation in _CONTAINER_ANNOTATIONS:
+            return True
+
+        if not isinstance(annotation, str):
+            # Unannotated, or an already-evaluated object that isn't
+            # Container; no eval_str pass could change the verdict.
+            return False
+
+        # A string annotation we can't match literally -- e.g. an alias
+        # of Container under `from __future__ import annotations` -- needs
+        # the signature machinery's eval_str resolution below.
+
+    try:
+        return _takes_container_slow(factory)
+    except TypeError:
+        # Unhashable callable -- can't cache, inspect it directly.
+        return _takes_container_slow.__wrapped__(factory)
+
+
+@lru_cache(maxsize=1024)
+def _takes_container_slow(factory: Callable) -> bool:
+    """
+    signature()-based detection for callables the code-object peek can't
+    answer.  Cached by factory identity because tests and local
+    registries re-register the same callables over and over.
+    """
     try:
         # Provide the locals so that `eval_str` will work even if the user
         # places the `Container` under a `if TYPE_CHECKING` block.
@@ -462,11 +678,7 @@ def _takes_container(factory: Callable) -> bool:
     except StopIteration:
         return False  # 0 arguments
 
-    return name == "svcs_container" or p.annotation in (
-        Container,
-        "svcs.Container",
-        "Container",
-    )
+    return name == "svcs_container" or p.annotation in _CONTAINER_ANNOTATIONS
 
 
 T1 = TypeVar("T1")
@@ -481,7 +693,6 @@ T9 = TypeVar("T9")
 T10 = TypeVar("T10")
 
 
-@attrs.define
 class Container:
     """
     A per-context container for instantiated services and cleanups.
@@ -513,17 +724,42 @@ class Container:
 
     """
 
+    # Containers are allocated once per request, so avoid the generated
+    # attrs machinery and keep construction as cheap as possible.
+    __slots__ = (
+        "__weakref__",
+        "_instantiated",
+        "_lazy_local_registry",
+        "_on_close",
+        "registry",
+    )
+
     registry: Registry
-    _lazy_local_registry: Registry | None = None
-    _instantiated: dict[type, object] = attrs.Factory(dict)
-    _on_close: list[
-        tuple[str, AbstractContextManager | AbstractAsyncContextManager]
-    ] = attrs.Factory(list)
+    _lazy_local_registry: Registry | None
+    _instantiated: dict[type, object]
+    _on_close: (
+        list[
+            tuple[
+                str,
+                AbstractContextManager | AbstractAsyncContextManager,
+                bool,
+            ]
+        ]
+        | None
+    )
+
+    def __init__(self, registry: Registry) -> None:
+        self.registry = registry
+        self._lazy_local_registry = None
+        self._instantiated = {}
+        # Most containers never register a cleanup -- allocate the list
+        # only when the first one arrives.
+        self._on_close = None
 
     def __repr__(self) -> str:
-        return (
-            f"<Container(instantiated={len(self._instantiated)}, "
-            f"cleanups={len(self._on_close)})>"
+        return _CONTAINER_REPR % (
+            len(self._instantiated),
+            len(self._on_close or ()),
         )
 
     def __contains__(self, svc_type: type) -> bool:
@@ -565,6 +801,20 @@ class Container:
                 stacklevel=1,
             )
 
+    def _add_cleanup(
+        self,
+        name: str,
+        cm: AbstractContextManager | AbstractAsyncContextManager,
+        is_async: bool,
+    ) -> None:
+        """
+        Schedule *cm*'s exit; *is_async* is known at the call sites, which
+        spares close()/aclose() an isinstance cascade per cleanup.
+        """
+        if (on_close := self._on_close) is None:
+            on_close = self._on_close = []
+        on_close.append((name, cm, is_async))
+
     def close(self) -> None:
         """
         Run all registered *synchronous* cleanups.
@@ -577,30 +827,36 @@ class Container:
             The Container can be used again after this. Closing it is an
             idempotent way to reset it.
         """
-        for name, cm in reversed(self._on_close):
-            try:
-                if isinstance(cm, AbstractAsyncContextManager):
-                    warnings.warn(
-                        f"Skipped async cleanup for {name!r}. "
-                        "Use aclose() instead.",
-                        # stacklevel doesn't matter here; it's coming from a
-                        # framework.
-                        stacklevel=1,
+        if (on_close := self._on_close) is not None:
+            # Swap the list out first, so re-entrant service acquisition
+            # during a cleanup starts a fresh one.  Bind the loop's global
+            # lookups to locals while we're at it.
+            self._on_close = None
+            warn = warnings.warn
+            log_warning = log.warning
+            while on_close:
+                name, cm, is_async = on_close.pop()
+                try:
+                    if is_async:
+                        warn(
+                            _ASYNC_CLEANUP_MSG % (name,),
+                            # stacklevel doesn't matter here; it's coming
+                            # from a framework.
+                            stacklevel=1,
+                        )
+                        continue
+
+                    cast(AbstractContextManager, cm).__exit__(None, None, None)
+                except Exception:  # noqa: BLE001
+                    log_warning(
+                        "Container clean up failed for %r.",
+                        name,
+                        exc_info=True,
+                        extra={"svcs_service_name": name},
                     )
-                    continue
-
-                cm.__exit__(None, None, None)
-            except Exception:  # noqa: BLE001
-                log.warning(
-                    "Container clean up failed for %r.",
-                    name,
-                    exc_info=True,
-                    extra={"svcs_service_name": name},
-                )
 
         if self._lazy_local_registry is not None:
             self._lazy_local_registry.close()
-        self._on_close.clear()
         self._instantiated.clear()
 
     async def aclose(self) -> None:
@@ -616,24 +872,31 @@ class Container:
             The container can be used again after this. Closing it is an
             idempotent way to reset it.
         """
-        for name, cm in reversed(self._on_close):
-            try:
-                if isinstance(cm, AbstractContextManager):
-                    cm.__exit__(None, None, None)
-                else:
-                    await cm.__aexit__(None, None, None)
-
-            except Exception:  # noqa: BLE001, PERF203
-                log.warning(
-                    "Container clean up failed for %r.",
-                    name,
-                    exc_info=True,
-                    extra={"svcs_service_name": name},
-                )
+        if (on_close := self._on_close) is not None:
+            self._on_close = None
+            log_warning = log.warning
+            while on_close:
+                name, cm, is_async = on_close.pop()
+                try:
+                    if is_async:
+                        await cast(AbstractAsyncContextManager, cm).__aexit__(
+                            None, None, None
+                        )
+                    else:
+                        cast(AbstractContextManager, cm).__exit__(
+                            None, None, None
+                        )
+
+                except Exception:  # noqa: BLE001
+                    log_warning(
+                        "Container clean up failed for %r.",
+                        name,
+                        exc_info=True,
+                        extra={"svcs_service_name": name},
+                    )
 
         if self._lazy_local_registry is not None:
             await self._lazy_local_registry.aclose()
-        self._on_close.clear()
         self._instantiated.clear()
 
     def get_pings(self) -> list[ServicePing]:
@@ -647,13 +910,13 @@ class Container:
         return [
             ServicePing(
                 rs.name,
-                iscoroutinefunction(rs.ping),
+                rs.ping_is_async,
                 rs.svc_type,
-                rs.ping,
+                # _pingable only ever holds services registered with a ping.
+                cast(Callable, rs.ping),
                 self,
             )
-            for rs in self.registry._services.values()
-            if rs.ping is not None
+            for rs in self.registry._pingable.values()
         ]
 
     def get_abstract(self, *svc_types: type) -> Any:
@@ -677,31 +940,124 @@ class Container:
         """
         return await self.aget(*svc_types)
 
-    def _lookup(self, svc_type: type) -> tuple[bool, object, str, bool]:
+    def _lookup(
+        self, svc_type: type
+    ) -> tuple[object, RegisteredService | None]:
         """
         Look up svc_type first in our cache, then in the registry.
 
-        If it's cached, only the first two items of the returned tupled are
-        meaningful.
+        Returns the cached instance and None on a hit, or the factory's
+        product together with its RegisteredService on a miss.
         """
-        if (
-            svc := self._instantiated.get(svc_type, attrs.NOTHING)
-        ) is not attrs.NOTHING:
-            return True, svc, "", False
+        try:
+            # EAFP: cache hits are the common case in warm containers and
+            # cost a single dict lookup this way.
+            return self._instantiated[svc_type], None
+        except KeyError:
+            pass
 
         rs = None
-        if self._lazy_local_registry is not None:
-            with suppress(ServiceNotFoundError):
-                rs = self._lazy_local_registry.get_registered_service_for(
-                    svc_type
-                )
+        if (local := self._lazy_local_registry) is not None:
+            rs = local._services.get(svc_type)
 
         if rs is None:
-            rs = self.registry.get_registered_service_for(svc_type)
+            try:
+                rs = self.registry._services[svc_type]
+            except KeyError:
+                raise ServiceNotFoundError(svc_type) from None
+
+        if rs.kind == _KIND_VALUE:
+            return rs.value, rs
 
         svc = rs.factory(self) if rs.takes_container else rs.factory()
 
-        return False, svc, rs.name, rs.enter
+        return svc, rs
+
+    def _get_one(
+        self,
+        svc_type: type,
+        *,
+        _iscoroutine: Callable = iscoroutine,
+        _cm: type = AbstractContextManager,
+        _acm: type = AbstractAsyncContextManager,
+    ) -> object:
+        """
+        Resolve a single service synchronously -- the dominant call shape.
+
+        The keyword-only defaults pin hot globals as locals; callers never
+        pass them.
+        """
+        svc, rs = self._lookup(svc_type)
+        if rs is None:
+            return svc
+
+        kind = rs.kind
+        if kind in (_KIND_CORO, _KIND_ACM) or (
+            kind != _KIND_CM and (_iscoroutine(svc) or isinstance(svc, _acm))
+        ):
+            msg = "Use `aget()` for async factories."
+            raise TypeError(msg)
+
+        if rs.enter and (kind == _KIND_CM or isinstance(svc, _cm)):
+            cm = cast(AbstractContextManager, svc)
+            self._add_cleanup(rs.name, cm, False)
+            svc = cm.__enter__()
+
+        self._instantiated[svc_type] = svc
+
+        return svc
+
+    async def _aget_one(
+        self,
+        svc_type: type,
+        *,
+        _isawaitable: Callable = isawaitable,
+        _cm: type = AbstractContextManager,
+        _acm: type = AbstractAsyncContextManager,
+    ) -> object:
+        """
+        Resolve a single service, asynchronously if necessary.
+
+        Keyword-only defaults as in :meth:`_get_one`.
+        """
+        svc, rs = self._lookup(svc_type)
+        if rs is None:
+            return svc
+
+        kind = rs.kind
+        enter = rs.enter
+        if enter and (
+            kind == _KIND_ACM or (kind != _KIND_CORO and isinstance(svc, _acm))
+        ):
+            acm = cast(AbstractAsyncContextManager, svc)
+            self._add_cleanup(rs.name, acm, True)
+            svc = await acm.__aenter__()
+        elif enter and (
+            kind == _KIND_CM or (kind != _KIND_CORO and isinstance(svc, _cm))
+        ):
+            cm = cast(AbstractContextManager, svc)
+            self._add_cleanup(rs.name, cm, False)
+            svc = cm.__enter__()
+        # _lookup() doesn't handle async factories, so we have to live with
+        # some repetition.
+        elif kind == _KIND_CORO or _isawaitable(svc):
+            # Execute the factory. Until now, we've only created the
+            # awaitable.
+            svc = await cast("Awaitable[object]", svc)
+
+            # Factory returned a contextmanager.
+            if enter and isinstance(svc, _acm):
+                acm = cast(AbstractAsyncContextManager, svc)
+                self._add_cleanup(rs.name, acm, True)
+                svc = await acm.__aenter__()
+            elif enter and isinstance(svc, _cm):
+                cm = cast(AbstractContextManager, svc)
+                self._add_cleanup(rs.name, cm, False)
+                svc = cm.__enter__()
+
+        self._instantiated[svc_type] = svc
+
+        return svc
 
     def register_local_factory(
         self,
@@ -763,9 +1119,12 @@ class Container:
 
         .. versionadded:: 23.21.0
         """
-        self.register_local_factory(
+        if self._lazy_local_registry is None:
+            self._lazy_local_registry = Registry()
+
+        self._lazy_local_registry.register_value(
             svc_type,
-            lambda: value,
+            value,
             enter=enter,
             ping=ping,
             on_registry_close=on_registry_close,
@@ -886,31 +1245,10 @@ class Container:
              requested, it's returned directly. If multiple are requested, a
              tuple of services is returned.
         """
-        rv = []
-        for svc_type in svc_types:
-            cached, svc, name, enter = self._lookup(svc_type)
-            if cached:
-                rv.append(svc)
-                continue
+        if len(svc_types) == 1:
+            return self._get_one(svc_types[0])
 
-            if iscoroutine(svc) or isinstance(
-                svc, AbstractAsyncContextManager
-            ):
-                msg = "Use `aget()` for async factories."
-                raise TypeError(msg)
-
-            if enter and isinstance(svc, AbstractContextManager):
-                self._on_close.append((name, svc))
-                svc = svc.__enter__()
-
-            self._instantiated[svc_type] = svc
-
-            rv.append(svc)
-
-        if len(rv) == 1:
-            return rv[0]
-
-        return rv
+        return [self._get_one(svc_type) for svc_type in svc_types]
 
     @overload
     async def aget(self, svc_type: type[T1], /) -> T1: ...
@@ -1026,39 +1364,12 @@ class Container:
         .. versionchanged:: 24.2.0
            Synchronous context managers are now entered/exited, too.
         """
-        rv = []
-        for svc_type in svc_types:
-            cached, svc, name, enter = self._lookup(svc_type)
-            if cached:
-                rv.append(svc)
-                continue
+        if len(svc_types) == 1:
+            return await self._aget_one(svc_types[0])
+
+        return [await self._aget_one(svc_type) for svc_type in svc_types]
+
 
-            if enter and isinstance(svc, AbstractAsyncContextManager):
-                self._on_close.append((name, svc))
-                svc = await svc.__aenter__()
-            elif enter and isinstance(svc, AbstractContextManager):
-                self._on_close.append((name, svc))
-                svc = svc.__enter__()
-            # _lookup() doesn't handle async factories, so we have to live with
-            # some repetition.
-            elif isawaitable(svc):
-                # Execute the factory. Until now, we've only created the
-                # awaitable.
-                svc = await svc
-
-                # Factory returned a contextmanager.
-                if enter and isinstance(svc, AbstractAsyncContextManager):
-                    self._on_close.append((name, svc))
-                    svc = await svc.__aenter__()
-                elif enter and isinstance(svc, AbstractContextManager):
-                    self._on_close.append((name, svc))
-                    svc = svc.__enter__()
-
-            self._instantiated[svc_type] = svc
-
-            rv.append(svc)
-
-        if len(rv) == 1:
-            return rv[0]
-
-        return rv
+# The annotations _takes_container() accepts for the container argument.
+# Built once; lives down here because it needs the Container class.
+_CONTAINER_ANNOTATIONS = (Container, "svcs.Container", "Container")
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2023 Hynek Schlawack <hs@ox.cx>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Shared Sybil configuration so conftest.py doesn't have to rebuild the
+parsers and Sybil objects on every collection.
+"""
+
+from doctest import ELLIPSIS
+from pathlib import Path
+
+from sybil import Sybil
+from sybil.parsers import myst, rest
+
+
+# Sybil anchors itself at the directory of the file that constructs it, so
+# point it back at the project root explicitly.
+_ROOT = str(Path(__file__).parent.parent)
+
+
+# Parsers are stateless across documents -- construct each exactly once.
+_md_doctest = myst.DocTestDirectiveParser(optionflags=ELLIPSIS)
+_md_code = myst.PythonCodeBlockParser(doctest_optionflags=ELLIPSIS)
+_md_skip = myst.SkipParser()
+_rest_doctest = rest.DocTestParser(optionflags=ELLIPSIS)
+_rest_code = rest.PythonCodeBlockParser()
+
+markdown_examples = Sybil(
+    parsers=[_md_doctest, _md_code, _md_skip],
+    patterns=["README.md", "docs/*.md", "docs/*/*.md"],
+    path=_ROOT,
+)
+
+rest_examples = Sybil(
+    parsers=[_rest_doctest, _rest_code],
+    patterns=["src/svcs/*.py", "docs/examples/*.py", "docs/examples/*/*.py"],
+    excludes=["**/__pycache__/*"],
+    path=_ROOT,
+)
+
+pytest_collect_file = (markdown_examples + rest_examples).pytest()
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2023 Hynek Schlawack <hs@ox.cx>
+#
+# SPDX-License-Identifier: MIT
+
+import sys
+
+import pytest
+
+import svcs
+
+
+class TestLazyIntegrations:
+    def test_unknown_attribute(self):
+        """
+        Unknown attributes raise an AttributeError that names them.
+        """
+        with pytest.raises(AttributeError, match="nonsense"):
+            svcs.nonsense  # noqa: B018
+
+    def test_missing_framework_is_attribute_error(self, monkeypatch):
+        """
+        If the underlying framework isn't installed, accessing the
+        integration raises AttributeError, so hasattr()/getattr() work.
+        """
+        monkeypatch.delattr(svcs, "pyramid", raising=False)
+
+        def boom(name, package):
+            raise ModuleNotFoundError
+
+        monkeypatch.setattr(svcs, "import_module", boom)
+
+        assert getattr(svcs, "pyramid", None) is None
+        assert not hasattr(svcs, "pyramid")
+
+    def test_resolved_integration_is_cached(self, monkeypatch):
+        """
+        A successful access imports the integration once and caches it on
+        the package.
+        """
+        pytest.importorskip("flask")
+        monkeypatch.delattr(svcs, "flask", raising=False)
+
+        mod = svcs.flask
+
+        assert sys.modules["svcs.flask"] is mod
+        assert "flask" in svcs.__dict__
+
+    def test_dir_advertises_integrations(self):
+        """
+        dir() lists the lazy integrations next to the eager names.
+        """
+        assert {"aiohttp", "fastapi", "flask", "pyramid", "starlette"} <= set(
+            dir(svcs)
+        )
+        assert "Registry" in dir(svcs)
@@ -458,6 +458,46 @@ class TestTakesContainer:
         """
         assert not svcs._core._takes_container(int)
 
+    @pytest.mark.parametrize("marker", [True, False])
+    def test_marker_beats_inspection(self, marker):
+        """
+        An explicit `__svcs_takes_container__` wins over both the name and
+        the annotation of the first argument.
+        """
+
+        def factory(svcs_container): ...
+
+        factory.__svcs_takes_container__ = marker
+
+        assert marker is svcs._core._takes_container(factory)
+
+    def test_marker_absent_falls_back(self):
+        """
+        Without the marker, the usual detection runs.
+        """
+
+        def factory(svcs_container): ...
+
+        assert svcs._core._takes_container(factory)
+
+    @pytest.mark.parametrize("marker", [True, False])
+    def test_marker_survives_generator_wrapping(self, marker, registry):
+        """
+        The contextmanager wrapper that generator factories get at
+        registration preserves the marker.
+        """
+
+        def factory(svcs_container):
+            yield 42
+
+        factory.__svcs_takes_container__ = marker
+
+        registry.register_factory(int, factory)
+
+        assert (
+            marker is registry.get_registered_service_for(int).takes_container
+        )
+
 
 class TestFullName:
     def test_object(self):